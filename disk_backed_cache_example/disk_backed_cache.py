@@ -4,7 +4,8 @@ import os
 import sqlite3
 import threading
 import time
-from typing import Optional, Type
+from collections import OrderedDict
+from typing import Any, Optional, Type
 
 from pydantic import BaseModel, ConfigDict, ValidationError
 
@@ -15,6 +16,40 @@ logging.addLevelName(TRACE, "TRACE")
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 
+_MAX_KEY_LENGTH = 256
+
+_SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+# Hot-path SQL, shared by every call site so sqlite3's statement cache always hits
+_SQL_SELECT_ENTRY = "SELECT value, schema_version, timestamp, size FROM cache WHERE key = ?"
+_SQL_SELECT_SIZE = "SELECT size FROM cache WHERE key = ?"
+_SQL_EXISTS = "SELECT 1 FROM cache WHERE key = ? LIMIT 1"
+_SQL_UPSERT = "INSERT OR REPLACE INTO cache (key, value, timestamp, schema_version, size) VALUES (?, ?, ?, ?, ?)"
+_SQL_TOUCH = "UPDATE cache SET timestamp = ? WHERE key = ?"
+_SQL_DELETE = "DELETE FROM cache WHERE key = ?"
+_SQL_DELETE_RETURNING_SIZE = "DELETE FROM cache WHERE key = ? RETURNING size"
+_SQL_SELECT_TOTALS = "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache"
+# LRU order (tie-break: alphabetically smallest key), served by the cache_lru covering index
+_SQL_SELECT_LRU = "SELECT key, size FROM cache ORDER BY timestamp ASC, key ASC"
+_SQL_SELECT_LRU_LIMIT = _SQL_SELECT_LRU + " LIMIT ?"
+_SQL_DELETE_LRU_RETURNING = (
+    "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY timestamp ASC, key ASC LIMIT ?) RETURNING key, size"
+)
+
+# RETURNING needs SQLite 3.35+; older libraries fall back to a SELECT before the DELETE
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# IN-list lookups are padded to one of these lengths so only a few distinct statements get prepared.
+# The largest bucket also keeps us under SQLite's bound-parameter limit.
+_IN_LIST_BUCKETS = (8, 64, 500)
+_SQL_SELECT_SIZES_IN = {n: f"SELECT key, size FROM cache WHERE key IN ({','.join('?' * n)})" for n in _IN_LIST_BUCKETS}
+_SQL_SELECT_ENTRIES_IN = {
+    n: f"SELECT key, value, schema_version, timestamp, size FROM cache WHERE key IN ({','.join('?' * n)})"
+    for n in _IN_LIST_BUCKETS
+}
+_SQL_DELETE_IN = {n: f"DELETE FROM cache WHERE key IN ({','.join('?' * n)})" for n in _IN_LIST_BUCKETS}
+_SQL_DELETE_IN_RETURNING = {n: _SQL_DELETE_IN[n] + " RETURNING key, size" for n in _IN_LIST_BUCKETS}
+
 
 class CacheableModel(BaseModel):
     model_config = ConfigDict(frozen=True)  # Makes objects immutable, otherwise cached objects can be modified...
@@ -40,7 +75,11 @@ class DiskBackedCache:
         memory_ttl_seconds: float,
         disk_ttl_seconds: float,
         max_item_size_bytes: int,  # items larger than this are disk-only
+        synchronous: str = "NORMAL",  # SQLite synchronous mode: "OFF", "NORMAL", "FULL" or "EXTRA"
     ) -> None:
+        if synchronous.upper() not in _SYNCHRONOUS_MODES:
+            raise ValueError(f"synchronous must be one of {', '.join(_SYNCHRONOUS_MODES)}, got {synchronous!r}")
+
         self._db_path = db_path
         self._model = model
         self._max_memory_items = max_memory_items
@@ -50,22 +89,30 @@ class DiskBackedCache:
         self._memory_ttl_seconds = memory_ttl_seconds
         self._disk_ttl_seconds = disk_ttl_seconds
         self._max_item_size_bytes = max_item_size_bytes
+        self._synchronous = synchronous.upper()
+
+        # Thread safety lock: guards memory structures, counters and the shared connection
+        self._lock = threading.RLock()
 
         # Extract schema version from model
         self._schema_version = self._extract_schema_version()
 
-        # In-memory cache storage
-        self._memory_cache: dict[str, CacheableModel] = {}
-        self._memory_timestamps: dict[str, float] = {}
+        # In-memory cache storage: key -> (object, size, timestamp), kept in LRU order (oldest first)
+        self._memory_cache: OrderedDict[str, tuple[CacheableModel, int, float]] = OrderedDict()
+        # False when an explicit timestamp broke the (timestamp, key) order; re-sorted lazily on eviction
+        self._memory_lru_ordered = True
 
         # Setup SQLite connection
         self._setup_database()
+        self._closed = False
 
         # Initialize counters
-        self._memory_item_count = 0
         self._memory_total_size = 0
 
-        # Initialize statistics counters
+        # Disk timestamp refreshes from memory hits, written in batches by _flush_timestamp_updates()
+        self._pending_timestamp_updates: dict[str, float] = {}
+
+        # Initialize statistics counters (only updated while holding self._lock)
         self._stats_memory_hits = 0
         self._stats_disk_hits = 0
         self._stats_misses = 0
@@ -75,9 +122,6 @@ class DiskBackedCache:
         self._stats_total_gets = 0
         self._stats_total_deletes = 0
 
-        # Thread safety lock
-        self._lock = threading.RLock()
-
     def _extract_schema_version(self) -> str:
         """Extract schema_version from the model class."""
         # Check if there's a default value on the model
@@ -98,46 +142,68 @@ class DiskBackedCache:
                 os.makedirs(db_dir, exist_ok=True)
 
         # Open connection
-        self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        self._conn = sqlite3.connect(self._db_path, check_same_thread=False, cached_statements=256)
+        # Reused for single-row key lookups; saves creating a cursor object per get()/exists()
+        self._lookup_cursor = self._conn.cursor()
 
         # Enable WAL mode
         self._conn.execute("PRAGMA journal_mode=WAL")
 
+        # Tune for a cache workload: with WAL, NORMAL only syncs on checkpoint, which may lose
+        # the most recent commits on power loss but never corrupts the database (FULL syncs every commit)
+        self._conn.execute(f"PRAGMA synchronous={self._synchronous}")
+        self._conn.execute("PRAGMA wal_autocheckpoint=1000")  # pages
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+        self._conn.execute("PRAGMA cache_size=-65536")  # 64MB
+        self._conn.execute("PRAGMA busy_timeout=5000")
+
         # Create table
         self._conn.execute(
             """
             CREATE TABLE IF NOT EXISTS cache (
                 key TEXT PRIMARY KEY,
-                value TEXT NOT NULL,
+                value BLOB NOT NULL,
                 timestamp REAL NOT NULL,
                 schema_version TEXT NOT NULL,
                 size INTEGER NOT NULL
             )
             """
         )
+
+        # Covering index for LRU eviction scans (avoids sorting the whole table)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_lru ON cache (timestamp, key, size)")
         self._conn.commit()
 
+        # Prime the running disk counters with one scan; kept up to date on every write and re-read before eviction
+        self._sync_disk_counters()
+
     def _validate_key(self, key: str) -> None:
         """Validate that key is a valid string within length limits."""
-        if not isinstance(key, str):
+        # Exact type check first: cheaper than isinstance() for the common case, subclasses still allowed
+        if type(key) is not str and not isinstance(key, str):
             raise TypeError(f"Key must be a string, got {type(key).__name__}")
-        if len(key) == 0:
+        key_length = len(key)
+        if 0 < key_length <= _MAX_KEY_LENGTH:
+            return
+        if key_length == 0:
             raise ValueError("Key cannot be empty")
-        if len(key) > 256:
-            raise ValueError(f"Key length {len(key)} exceeds maximum of 256 characters")
+        raise ValueError(f"Key length {key_length} exceeds maximum of {_MAX_KEY_LENGTH} characters")
 
-    def _serialize(self, value: CacheableModel) -> str:
-        """Serialize a CacheableModel to JSON string."""
-        return value.model_dump_json()
+    def _serialize(self, value: CacheableModel) -> bytes:
+        """Serialize a CacheableModel to UTF-8 encoded JSON bytes (stored as a BLOB)."""
+        # Same output as model_dump_json().encode(), but pydantic-core hands back the bytes directly
+        return value.__pydantic_serializer__.to_json(value)
 
-    def _deserialize(self, json_str: str) -> CacheableModel:
-        """Deserialize JSON string to CacheableModel.
+    def _deserialize(self, json_str: bytes | str) -> CacheableModel:
+        """Deserialize JSON (bytes, or str for rows written before BLOB storage) to CacheableModel.
 
         Raises:
             ValueError: If JSON is invalid or doesn't match model schema
         """
         try:
-            return self._model.model_validate_json(json_str)
+            # model_validate_json() without its Python-level argument handling
+            return self._model.__pydantic_validator__.validate_json(json_str)
         except (ValidationError, json.JSONDecodeError) as e:
             raise ValueError(f"Failed to deserialize JSON: {e}") from e
 
@@ -145,26 +211,50 @@ class DiskBackedCache:
         """Calculate the size of a serialized object in bytes."""
         return len(self._serialize(value))
 
+    def _install_in_memory(self, key: str, value: CacheableModel, size: int, timestamp: float) -> None:
+        """Store an entry at the most recently used end of the memory LRU order, replacing any old one.
+
+        Keeps the memory size total up to date; callers run eviction afterwards. If the entry sorts before
+        the current newest entry by (timestamp, key), the order is marked stale and re-sorted on next eviction.
+        """
+        old_entry = self._memory_cache.pop(key, None)
+        if old_entry is not None:
+            self._memory_total_size -= old_entry[1]
+        if self._memory_lru_ordered and self._memory_cache:
+            newest_key = next(reversed(self._memory_cache))
+            if (timestamp, key) < (self._memory_cache[newest_key][2], newest_key):
+                self._memory_lru_ordered = False
+        self._memory_cache[key] = (value, size, timestamp)
+        self._memory_total_size += size
+
+    def _discard_from_memory(self, key: str) -> None:
+        """Remove key from memory if present."""
+        old_entry = self._memory_cache.pop(key, None)
+        if old_entry is not None:
+            self._memory_total_size -= old_entry[1]
+
+    def _pop_lru_from_memory(self) -> tuple[str, int]:
+        """Remove the least recently used memory entry and return its key and size.
+
+        Tie-breaking: alphabetically smallest key when timestamps equal.
+        """
+        if not self._memory_lru_ordered:
+            entries = sorted(self._memory_cache.items(), key=lambda item: (item[1][2], item[0]))
+            self._memory_cache.clear()
+            self._memory_cache.update(entries)
+            self._memory_lru_ordered = True
+        lru_key, (_, size, _) = self._memory_cache.popitem(last=False)
+        self._memory_total_size -= size
+        return lru_key, size
+
     def _evict_from_memory_by_count(self) -> None:
         """Evict items from memory when count exceeds max_memory_items.
 
         Evicts least recently used items one at a time.
-        Tie-breaking: alphabetically smallest key when timestamps equal.
         """
-        while self._memory_item_count > self._max_memory_items:
-            # Find least recently used item
-            lru_key = min(
-                self._memory_timestamps.keys(),
-                key=lambda k: (self._memory_timestamps[k], k),  # Sort by (timestamp, key)
-            )
-
-            logger.log(TRACE, f"evicting from memory (count): key={lru_key!r}")
-            # Remove from memory (keep on disk)
-            obj_size = self._calculate_size(self._memory_cache[lru_key])
-            del self._memory_cache[lru_key]
-            del self._memory_timestamps[lru_key]
-            self._memory_item_count -= 1
-            self._memory_total_size -= obj_size
+        while len(self._memory_cache) > self._max_memory_items:
+            lru_key, _ = self._pop_lru_from_memory()
+            logger.log(TRACE, "evicting from memory (count): key=%r", lru_key)
 
             # Update statistics
             self._stats_memory_evictions += 1
@@ -173,372 +263,451 @@ class DiskBackedCache:
         """Evict items from memory when size exceeds max_memory_size_bytes.
 
         Evicts least recently used items one at a time.
-        Tie-breaking: alphabetically smallest key when timestamps equal.
         """
         while self._memory_total_size > self._max_memory_size_bytes:
-            # Find least recently used item
-            lru_key = min(
-                self._memory_timestamps.keys(),
-                key=lambda k: (self._memory_timestamps[k], k),  # Sort by (timestamp, key)
-            )
-
-            logger.log(TRACE, f"evicting from memory (size): key={lru_key!r}")
-            # Remove from memory (keep on disk)
-            obj_size = self._calculate_size(self._memory_cache[lru_key])
-            del self._memory_cache[lru_key]
-            del self._memory_timestamps[lru_key]
-            self._memory_item_count -= 1
-            self._memory_total_size -= obj_size
+            lru_key, _ = self._pop_lru_from_memory()
+            logger.log(TRACE, "evicting from memory (size): key=%r", lru_key)
 
             # Update statistics
             self._stats_memory_evictions += 1
 
-    def _evict_from_disk_by_count(self) -> None:
-        """Evict items from disk when count exceeds max_disk_items.
+    def _batch_keys_fitting_in_memory(
+        self, serialized_items: dict[str, tuple[bytes, int]], timestamp: float
+    ) -> set[str]:
+        """Return the keys of a put_many batch that can survive memory eviction.
 
-        Evicts least recently used items one at a time.
-        Tie-breaking: alphabetically smallest key when timestamps equal.
-        Cascades to memory: evicted items also removed from memory.
+        Batch items share one timestamp, so their LRU order is by key. Walking from the most recently
+        used (alphabetically largest) key, once the batch alone exceeds the memory limits every older
+        item would be evicted anyway and is not inserted at all. Older entries already in memory are
+        evicted here for the same reason. If memory holds anything newer than the batch, no items are
+        skipped and the normal eviction pass decides.
         """
-        # Get current disk count
-        cursor = self._conn.execute("SELECT COUNT(*) FROM cache")
-        disk_count = cursor.fetchone()[0]
+        eligible = {key: size for key, (_, size) in serialized_items.items() if size <= self._max_item_size_bytes}
+        if len(eligible) <= self._max_memory_items and sum(eligible.values()) <= self._max_memory_size_bytes:
+            return set(eligible)
+
+        oldest_in_batch = (timestamp, min(eligible))
+        older_keys: list[str] = []
+        for key, (_, _, entry_timestamp) in self._memory_cache.items():
+            if key in serialized_items:
+                continue
+            if (entry_timestamp, key) > oldest_in_batch:
+                return set(eligible)
+            older_keys.append(key)
+
+        kept: set[str] = set()
+        kept_size = 0
+        for key in sorted(eligible, reverse=True):
+            kept_size += eligible[key]
+            if len(kept) >= self._max_memory_items or kept_size > self._max_memory_size_bytes:
+                break
+            kept.add(key)
 
-        while disk_count > self._max_disk_items:
-            # Find least recently used item from disk
-            cursor = self._conn.execute("SELECT key, timestamp FROM cache ORDER BY timestamp ASC, key ASC LIMIT 1")
-            row = cursor.fetchone()
+        for key in older_keys:
+            logger.log(TRACE, "evicting from memory (batch): key=%r", key)
+            self._discard_from_memory(key)
+            self._stats_memory_evictions += 1
+        return kept
 
-            if row is None:
-                break
+    def _disk_size_of(self, key: str) -> Optional[int]:
+        """Return the stored size of key on disk, or None if it is not on disk."""
+        cursor = self._lookup_cursor.execute(_SQL_SELECT_SIZE, (key,))
+        row = cursor.fetchone()
+        return row[0] if row is not None else None
 
-            lru_key = row[0]
+    def _execute_in_list(self, statements: dict[int, str], keys: list[str]) -> list[Any]:
+        """Run an IN-list statement (one per bucket length) for the given keys and return all rows.
 
-            logger.log(TRACE, f"evicting from disk (count): key={lru_key!r}")
-            # Remove from disk
-            self._conn.execute("DELETE FROM cache WHERE key = ?", (lru_key,))
-            self._conn.commit()
+        Looks keys up in chunks to stay under SQLite's bound-parameter limit. Each chunk is padded
+        with repeats of its last key up to a fixed bucket length so the prepared statement is reused.
+        """
+        rows: list[Any] = []
+        max_chunk = _IN_LIST_BUCKETS[-1]
+        for start in range(0, len(keys), max_chunk):
+            chunk = keys[start : start + max_chunk]
+            bucket = next(n for n in _IN_LIST_BUCKETS if n >= len(chunk))
+            chunk += [chunk[-1]] * (bucket - len(chunk))
+            rows.extend(self._conn.execute(statements[bucket], chunk).fetchall())
+        return rows
+
+    def _disk_sizes_of(self, keys: list[str]) -> dict[str, int]:
+        """Return the stored sizes of the given keys that are on disk."""
+        return dict(self._execute_in_list(_SQL_SELECT_SIZES_IN, keys))
+
+    def _sync_disk_counters(self) -> None:
+        """Re-read the disk counters from the table.
+
+        Other connections to the same database file may have written since the last sync, so
+        eviction re-reads the counters inside its write transaction before deciding what to delete.
+        """
+        self._disk_count, self._disk_total_size = self._conn.execute(_SQL_SELECT_TOTALS).fetchone()
 
-            # Cascade: Remove from memory if present
-            if lru_key in self._memory_cache:
-                obj_size = self._calculate_size(self._memory_cache[lru_key])
-                del self._memory_cache[lru_key]
-                del self._memory_timestamps[lru_key]
-                self._memory_item_count -= 1
-                self._memory_total_size -= obj_size
+    def _subtract_from_disk_counters(self, count: int, size: int) -> None:
+        """Account for rows this connection deleted, never going below zero."""
+        # Rows written by another connection since the last sync can make the counters lag behind
+        self._disk_count = max(0, self._disk_count - count)
+        self._disk_total_size = max(0, self._disk_total_size - size)
 
-            # Update statistics
-            self._stats_disk_evictions += 1
+    def _delete_from_disk(self, key: str, size: int) -> None:
+        """Delete a single item of known size from disk."""
+        cursor = self._conn.execute(_SQL_DELETE, (key,))
+        self._conn.commit()
+        # Another connection may already have deleted the row
+        if cursor.rowcount > 0:
+            self._subtract_from_disk_counters(1, size)
+
+    def _pop_from_disk(self, key: str) -> Optional[int]:
+        """Delete key from disk and return its stored size, or None if it was not on disk."""
+        if _SQLITE_HAS_RETURNING:
+            row = self._conn.execute(_SQL_DELETE_RETURNING_SIZE, (key,)).fetchone()
+            size = row[0] if row is not None else None
+        else:
+            size = self._disk_size_of(key)
+            # Another connection may have deleted the row in between
+            if size is not None and self._conn.execute(_SQL_DELETE, (key,)).rowcount == 0:
+                size = None
+        self._conn.commit()
 
-            # Update count
-            disk_count -= 1
+        if size is not None:
+            self._subtract_from_disk_counters(1, size)
+        return size
 
-    def _evict_from_disk_by_size(self) -> None:
-        """Evict items from disk when size exceeds max_disk_size_bytes.
+    def _flush_timestamp_updates(self, commit: bool = True) -> None:
+        """Write buffered access timestamps to disk in a single transaction.
 
-        Evicts least recently used items one at a time.
-        Tie-breaking: alphabetically smallest key when timestamps equal.
-        Cascades to memory: evicted items also removed from memory.
+        With commit=False the updates join the open transaction, which the caller commits.
         """
-        # Get current disk size
-        cursor = self._conn.execute("SELECT SUM(size) FROM cache")
-        result = cursor.fetchone()[0]
-        disk_size = result if result is not None else 0
-
-        while disk_size > self._max_disk_size_bytes:
-            # Find least recently used item from disk
-            cursor = self._conn.execute(
-                "SELECT key, timestamp, size FROM cache ORDER BY timestamp ASC, key ASC LIMIT 1"
-            )
-            row = cursor.fetchone()
+        if not self._pending_timestamp_updates:
+            return
+        self._conn.executemany(
+            _SQL_TOUCH,
+            [(timestamp, key) for key, timestamp in self._pending_timestamp_updates.items()],
+        )
+        if commit:
+            self._conn.commit()
+        self._pending_timestamp_updates.clear()
 
-            if row is None:
-                break
+    def _remove_evicted_from_disk(self, victims: list[tuple[str, int]], reason: str) -> None:
+        """Delete evicted (key, size) items from disk in one transaction and cascade the eviction to memory."""
+        self._execute_in_list(_SQL_DELETE_IN, [lru_key for lru_key, _ in victims])
+        self._conn.commit()
+        self._record_disk_evictions(victims, reason)
 
-            lru_key, _, item_size = row
-
-            logger.log(TRACE, f"evicting from disk (size): key={lru_key!r}")
-            # Remove from disk
-            self._conn.execute("DELETE FROM cache WHERE key = ?", (lru_key,))
-            self._conn.commit()
+    def _record_disk_evictions(self, victims: list[tuple[str, int]], reason: str) -> None:
+        """Update counters and statistics for (key, size) items already deleted from disk, and evict them from memory."""
+        if logger.isEnabledFor(TRACE):
+            for lru_key, _ in victims:
+                logger.log(TRACE, "evicting from disk (%s): key=%r", reason, lru_key)
 
+        self._subtract_from_disk_counters(len(victims), sum(item_size for _, item_size in victims))
+        for lru_key, _ in victims:
             # Cascade: Remove from memory if present
-            if lru_key in self._memory_cache:
-                obj_size = self._calculate_size(self._memory_cache[lru_key])
-                del self._memory_cache[lru_key]
-                del self._memory_timestamps[lru_key]
-                self._memory_item_count -= 1
-                self._memory_total_size -= obj_size
+            self._discard_from_memory(lru_key)
 
-            # Update statistics
-            self._stats_disk_evictions += 1
+        # Update statistics
+        self._stats_disk_evictions += len(victims)
 
-            # Update size
-            disk_size -= item_size
-
-    def get(self, key: str, timestamp: Optional[float] = None) -> Optional[CacheableModel]:
-        """Retrieve item from cache, checking memory first then disk."""
-        self._validate_key(key)
-        logger.log(TRACE, f"get(key={key!r})")
+    def _evict_from_disk_by_count(self) -> None:
+        """Evict items from disk when count exceeds max_disk_items.
 
-        with self._lock:
-            self._stats_total_gets += 1
+        Deletes all least recently used victims with a single DELETE ... RETURNING statement
+        (SELECT + batched DELETE on SQLite older than 3.35). Tie-breaking: alphabetically smallest key when timestamps equal.
+        Cascades to memory: evicted items also removed from memory.
+        """
+        self._sync_disk_counters()
+        if self._disk_count <= self._max_disk_items:
+            return
 
-        if timestamp is None:
-            timestamp = time.time()
+        # Count again under the write lock: another connection may have deleted rows since the read above
+        self._conn.execute("BEGIN IMMEDIATE")
+        self._sync_disk_counters()
+        excess_count = self._disk_count - self._max_disk_items
+        if excess_count <= 0:
+            self._conn.commit()
+            return
 
-        # Check memory first
-        if key in self._memory_cache:
-            # Check TTL
-            memory_timestamp = self._memory_timestamps[key]
-            if timestamp - memory_timestamp > self._memory_ttl_seconds:
-                # Expired - remove from memory and continue to disk check
-                logger.log(TRACE, f"get(key={key!r}): expired from memory (TTL exceeded)")
-                obj_size = self._calculate_size(self._memory_cache[key])
-                del self._memory_cache[key]
-                del self._memory_timestamps[key]
-                self._memory_item_count -= 1
-                self._memory_total_size -= obj_size
-            else:
-                # Not expired - update timestamps for LRU
-                logger.log(TRACE, f"get(key={key!r}): memory hit")
-                self._memory_timestamps[key] = timestamp
-                # Also update disk timestamp to keep them in sync
-                self._conn.execute(
-                    "UPDATE cache SET timestamp = ? WHERE key = ?",
-                    (timestamp, key),
-                )
-                self._conn.commit()
-                self._stats_memory_hits += 1
-                return self._memory_cache[key]
+        # LRU order on disk must reflect buffered access timestamps (committed together with the eviction)
+        self._flush_timestamp_updates(commit=False)
 
-        # Check disk
-        cursor = self._conn.execute(
-            "SELECT value, schema_version, timestamp FROM cache WHERE key = ?",
-            (key,),
-        )
-        row = cursor.fetchone()
+        if _SQLITE_HAS_RETURNING:
+            victims: list[tuple[str, int]] = self._conn.execute(_SQL_DELETE_LRU_RETURNING, (excess_count,)).fetchall()
+            self._conn.commit()
+            self._record_disk_evictions(victims, "count")
+        else:
+            victims = self._conn.execute(_SQL_SELECT_LRU_LIMIT, (excess_count,)).fetchall()
+            self._remove_evicted_from_disk(victims, "count")
 
-        if row is None:
-            logger.log(TRACE, f"get(key={key!r}): miss (not found)")
-            self._stats_misses += 1
-            return None
+    def _evict_from_disk_by_size(self) -> None:
+        """Evict items from disk when size exceeds max_disk_size_bytes.
 
-        value_json, stored_schema_version, disk_timestamp = row
+        Walks items in LRU order until enough size is freed, then deletes them in one transaction.
+        Tie-breaking: alphabetically smallest key when timestamps equal.
+        Cascades to memory: evicted items also removed from memory.
+        """
+        # Always runs right after _evict_from_disk_by_count(), which has just re-read the counters
+        if self._disk_total_size <= self._max_disk_size_bytes:
+            return
 
-        # Check TTL
-        if timestamp - disk_timestamp > self._disk_ttl_seconds:
-            # Expired - delete and return None
-            logger.log(TRACE, f"get(key={key!r}): expired from disk (TTL exceeded)")
-            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+        # Sum again under the write lock: another connection may have deleted rows since the last read
+        self._conn.execute("BEGIN IMMEDIATE")
+        self._sync_disk_counters()
+        disk_size = self._disk_total_size
+        if disk_size <= self._max_disk_size_bytes:
             self._conn.commit()
-            self._stats_misses += 1
-            return None
-
-        # Validate schema version
-        if stored_schema_version != self._schema_version:
-            # Schema mismatch - delete and return None
-            logger.log(
-                TRACE,
-                f"get(key={key!r}): schema version mismatch (stored={stored_schema_version!r}, expected={self._schema_version!r})",
-            )
-            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
-            self._conn.commit()
-            self._stats_misses += 1
-            return None
+            return
 
-        # Deserialize
-        try:
-            obj = self._deserialize(value_json)
-        except ValueError as e:
-            # Deserialization failed - delete and return None
-            logger.log(TRACE, f"get(key={key!r}): deserialization failed: {e}")
-            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
-            self._conn.commit()
-            self._stats_misses += 1
-            return None
+        # LRU order on disk must reflect buffered access timestamps (committed together with the eviction)
+        self._flush_timestamp_updates(commit=False)
 
-        # Update timestamp on disk
-        self._conn.execute(
-            "UPDATE cache SET timestamp = ? WHERE key = ?",
-            (timestamp, key),
-        )
-        self._conn.commit()
+        victims: list[tuple[str, int]] = []
+        cursor = self._conn.execute(_SQL_SELECT_LRU)
+        for lru_key, item_size in cursor:
+            if disk_size <= self._max_disk_size_bytes:
+                break
+            victims.append((lru_key, item_size))
+            disk_size -= item_size
+        cursor.close()
 
-        # Load into memory (only if size <= max_item_size_bytes)
-        obj_size = len(value_json)
-        if obj_size <= self._max_item_size_bytes:
-            if key not in self._memory_cache:
-                self._memory_item_count += 1
-                self._memory_total_size += obj_size
-            else:
-                # Update size
-                old_size = self._calculate_size(self._memory_cache[key])
-                self._memory_total_size = self._memory_total_size - old_size + obj_size
-            self._memory_cache[key] = obj
-            self._memory_timestamps[key] = timestamp
+        self._remove_evicted_from_disk(victims, "size")
 
-            # Evict from memory if needed
-            self._evict_from_memory_by_count()
-            self._evict_from_memory_by_size()
+    def get(self, key: str, timestamp: Optional[float] = None) -> Optional[CacheableModel]:
+        """Retrieve item from cache, checking memory first then disk."""
+        with self._lock:
+            self._validate_key(key)
+            logger.log(TRACE, "get(key=%r)", key)
 
-        logger.log(TRACE, f"get(key={key!r}): disk hit")
-        self._stats_disk_hits += 1
-        return obj
+            self._stats_total_gets += 1
 
-    def put(self, key: str, value: CacheableModel, timestamp: Optional[float] = None) -> None:
-        """Store item in both memory and disk cache."""
-        self._validate_key(key)
-        logger.log(TRACE, f"put(key={key!r})")
-        self._stats_total_puts += 1
+            # Wall clock on purpose: the same timestamp drives memory and disk TTL/LRU ordering, is persisted
+            # across restarts and can be supplied by the caller, so a process-local monotonic clock can't be used
+            if timestamp is None:
+                timestamp = time.time()
 
-        # Validate model type
-        if not isinstance(value, self._model):
-            raise TypeError(f"Value must be an instance of {self._model.__name__}, got {type(value).__name__}")
+            # Check memory first
+            memory_entry = self._memory_cache.get(key)
+            if memory_entry is not None:
+                # Check TTL
+                obj, size, memory_timestamp = memory_entry
+                if timestamp - memory_timestamp > self._memory_ttl_seconds:
+                    # Expired - remove from memory and continue to disk check
+                    logger.log(TRACE, "get(key=%r): expired from memory (TTL exceeded)", key)
+                    self._discard_from_memory(key)
+                else:
+                    # Not expired - update timestamps for LRU
+                    logger.log(TRACE, "get(key=%r): memory hit", key)
+                    self._install_in_memory(key, obj, size, timestamp)
+                    # Buffer the disk timestamp update instead of writing on every hit
+                    self._pending_timestamp_updates[key] = timestamp
+                    if len(self._pending_timestamp_updates) > 128:
+                        self._flush_timestamp_updates()
+                    self._stats_memory_hits += 1
+                    return obj
 
-        if timestamp is None:
-            timestamp = time.time()
+            # Check disk (always probed: another connection may have written the row)
+            row = self._lookup_cursor.execute(_SQL_SELECT_ENTRY, (key,)).fetchone()
 
-        # Serialize and calculate size
-        value_json = self._serialize(value)
-        size = len(value_json)
+            if row is None:
+                logger.log(TRACE, "get(key=%r): miss (not found)", key)
+                self._stats_misses += 1
+                return None
 
-        # Validate size doesn't exceed disk limit
-        if size > self._max_disk_size_bytes:
-            raise ValueError(
-                f"Item size ({size} bytes) exceeds max_disk_size_bytes ({self._max_disk_size_bytes} bytes)"
-            )
+            value_json, stored_schema_version, disk_timestamp, disk_size = row
+            disk_timestamp = self._pending_timestamp_updates.pop(key, disk_timestamp)
 
-        # Store to disk
-        self._conn.execute(
-            """
-            INSERT OR REPLACE INTO cache (key, value, timestamp, schema_version, size)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (key, value_json, timestamp, self._schema_version, size),
-        )
-        self._conn.commit()
+            # Check TTL
+            if timestamp - disk_timestamp > self._disk_ttl_seconds:
+                # Expired - delete and return None
+                logger.log(TRACE, "get(key=%r): expired from disk (TTL exceeded)", key)
+                self._delete_from_disk(key, disk_size)
+                self._stats_misses += 1
+                return None
 
-        # Store in memory (only if size <= max_item_size_bytes)
-        if size <= self._max_item_size_bytes:
-            if key not in self._memory_cache:
-                self._memory_item_count += 1
-                self._memory_total_size += size
-            else:
-                # Update size (subtract old, add new)
-                old_size = self._calculate_size(self._memory_cache[key])
-                self._memory_total_size = self._memory_total_size - old_size + size
-            self._memory_cache[key] = value
-            self._memory_timestamps[key] = timestamp
+            # Validate schema version
+            if stored_schema_version != self._schema_version:
+                # Schema mismatch - delete and return None
+                logger.log(
+                    TRACE,
+                    "get(key=%r): schema version mismatch (stored=%r, expected=%r)",
+                    key,
+                    stored_schema_version,
+                    self._schema_version,
+                )
+                self._delete_from_disk(key, disk_size)
+                self._stats_misses += 1
+                return None
 
-            # Evict from memory if needed
-            self._evict_from_memory_by_count()
-            self._evict_from_memory_by_size()
-        else:
-            # Item too large for memory - remove from memory if present
-            if key in self._memory_cache:
-                obj_size = self._calculate_size(self._memory_cache[key])
-                del self._memory_cache[key]
-                del self._memory_timestamps[key]
-                self._memory_item_count -= 1
-                self._memory_total_size -= obj_size
+            # Deserialize
+            try:
+                obj = self._deserialize(value_json)
+            except ValueError as e:
+                # Deserialization failed - delete and return None
+                logger.log(TRACE, "get(key=%r): deserialization failed: %s", key, e)
+                self._delete_from_disk(key, disk_size)
+                self._stats_misses += 1
+                return None
 
-        # Evict from disk if needed
-        self._evict_from_disk_by_count()
-        self._evict_from_disk_by_size()
+            # Update timestamp on disk
+            self._conn.execute(_SQL_TOUCH, (timestamp, key))
+            self._conn.commit()
 
-    def put_many(self, items: dict[str, CacheableModel], timestamp: Optional[float] = None) -> None:
-        """Atomically store multiple items in the cache.
+            # Load into memory (only if size <= max_item_size_bytes)
+            if disk_size <= self._max_item_size_bytes:
+                self._install_in_memory(key, obj, disk_size, timestamp)
 
-        All items succeed or all fail. Uses a single transaction for disk operations.
-        """
-        logger.log(TRACE, f"put_many(count={len(items)})")
-        # Validate all keys first
-        for key in items.keys():
+                # Evict from memory if needed
+                self._evict_from_memory_by_count()
+                self._evict_from_memory_by_size()
+
+            logger.log(TRACE, "get(key=%r): disk hit", key)
+            self._stats_disk_hits += 1
+            return obj
+
+    def put(self, key: str, value: CacheableModel, timestamp: Optional[float] = None) -> None:
+        """Store item in both memory and disk cache."""
+        with self._lock:
             self._validate_key(key)
+            logger.log(TRACE, "put(key=%r)", key)
+            self._stats_total_puts += 1
 
-        # Validate all values first
-        for value in items.values():
+            # Validate model type
             if not isinstance(value, self._model):
                 raise TypeError(f"Value must be an instance of {self._model.__name__}, got {type(value).__name__}")
 
-        # If no items, return early
-        if not items:
-            return
-
-        # Get timestamp
-        if timestamp is None:
-            timestamp = time.time()
+            if timestamp is None:
+                timestamp = time.time()
 
-        # Prepare serialized data for all items
-        serialized_items: dict[str, tuple[str, int]] = {}
-        for key, value in items.items():
+            # Serialize and calculate size
             value_json = self._serialize(value)
             size = len(value_json)
 
             # Validate size doesn't exceed disk limit
             if size > self._max_disk_size_bytes:
                 raise ValueError(
-                    f"Item size for key {key!r} ({size} bytes) exceeds max_disk_size_bytes ({self._max_disk_size_bytes} bytes)"
+                    f"Item size ({size} bytes) exceeds max_disk_size_bytes ({self._max_disk_size_bytes} bytes)"
                 )
 
-            serialized_items[key] = (value_json, size)
+            # This put's timestamp supersedes any buffered one
+            self._pending_timestamp_updates.pop(key, None)
 
-        # Store all items to disk in a single transaction
-        try:
-            # Begin transaction explicitly
-            self._conn.execute("BEGIN")
-
-            for key, (value_json, size) in serialized_items.items():
-                self._conn.execute(
-                    """
-                    INSERT OR REPLACE INTO cache (key, value, timestamp, schema_version, size)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (key, value_json, timestamp, self._schema_version, size),
-                )
-
-            # Commit transaction
+            # Store to disk
+            old_disk_size = self._disk_size_of(key)
+            self._conn.execute(_SQL_UPSERT, (key, value_json, timestamp, self._schema_version, size))
             self._conn.commit()
-        except Exception:
-            # Rollback on error
-            self._conn.rollback()
-            raise
-
-        # Update memory cache after successful disk commit (only for items <= max_item_size_bytes)
-        for key, value in items.items():
-            size = serialized_items[key][1]
+            if old_disk_size is None:
+                self._disk_count += 1
+                self._disk_total_size += size
+            else:
+                self._disk_total_size += size - old_disk_size
 
+            # Store in memory (only if size <= max_item_size_bytes)
             if size <= self._max_item_size_bytes:
-                if key not in self._memory_cache:
-                    self._memory_item_count += 1
-                    self._memory_total_size += size
-                else:
-                    # Update size (subtract old, add new)
-                    old_size = self._calculate_size(self._memory_cache[key])
-                    self._memory_total_size = self._memory_total_size - old_size + size
+                self._install_in_memory(key, value, size, timestamp)
 
-                self._memory_cache[key] = value
-                self._memory_timestamps[key] = timestamp
+                # Evict from memory if needed
+                self._evict_from_memory_by_count()
+                self._evict_from_memory_by_size()
             else:
                 # Item too large for memory - remove from memory if present
-                if key in self._memory_cache:
-                    obj_size = self._calculate_size(self._memory_cache[key])
-                    del self._memory_cache[key]
-                    del self._memory_timestamps[key]
-                    self._memory_item_count -= 1
-                    self._memory_total_size -= obj_size
+                self._discard_from_memory(key)
+
+            # Evict from disk if needed
+            self._evict_from_disk_by_count()
+            self._evict_from_disk_by_size()
 
-        # Evict from memory if needed
-        self._evict_from_memory_by_count()
-        self._evict_from_memory_by_size()
+    def put_many(self, items: dict[str, CacheableModel], timestamp: Optional[float] = None) -> None:
+        """Atomically store multiple items in the cache.
+
+        All items succeed or all fail. Uses a single transaction for disk operations.
+        """
+        with self._lock:
+            logger.log(TRACE, "put_many(count=%d)", len(items))
+            # Validate all keys first
+            validate_key = self._validate_key
+            for key in items.keys():
+                validate_key(key)
+
+            # Validate all values first
+            for value in items.values():
+                if not isinstance(value, self._model):
+                    raise TypeError(f"Value must be an instance of {self._model.__name__}, got {type(value).__name__}")
+
+            # If no items, return early
+            if not items:
+                return
+
+            # Get timestamp
+            if timestamp is None:
+                timestamp = time.time()
+
+            # Prepare serialized data for all items
+            serialized_items: dict[str, tuple[bytes, int]] = {}
+            for key, value in items.items():
+                value_json = self._serialize(value)
+                size = len(value_json)
+
+                # Validate size doesn't exceed disk limit
+                if size > self._max_disk_size_bytes:
+                    raise ValueError(
+                        f"Item size for key {key!r} ({size} bytes) exceeds max_disk_size_bytes ({self._max_disk_size_bytes} bytes)"
+                    )
+
+                serialized_items[key] = (value_json, size)
+
+            # These puts' timestamp supersedes any buffered ones
+            for key in items:
+                self._pending_timestamp_updates.pop(key, None)
+
+            # Store all items to disk in a single transaction
+            try:
+                # Begin transaction explicitly, taking the write lock up front
+                self._conn.execute("BEGIN IMMEDIATE")
+
+                old_disk_sizes = self._disk_sizes_of(list(serialized_items))
+                count_delta = len(serialized_items) - len(old_disk_sizes)
+                size_delta = sum(size for _, size in serialized_items.values()) - sum(old_disk_sizes.values())
+
+                self._conn.executemany(
+                    _SQL_UPSERT,
+                    [
+                        (key, value_json, timestamp, self._schema_version, size)
+                        for key, (value_json, size) in serialized_items.items()
+                    ],
+                )
 
-        # Evict from disk if needed
-        self._evict_from_disk_by_count()
-        self._evict_from_disk_by_size()
+                # Commit transaction
+                self._conn.commit()
+            except Exception:
+                # Rollback on error
+                self._conn.rollback()
+                raise
+
+            self._disk_count += count_delta
+            self._disk_total_size += size_delta
+
+            # Update memory cache after successful disk commit (only for items <= max_item_size_bytes)
+            memory_keys = self._batch_keys_fitting_in_memory(serialized_items, timestamp)
+            for key, value in items.items():
+                size = serialized_items[key][1]
+
+                if key in memory_keys:
+                    self._install_in_memory(key, value, size, timestamp)
+                else:
+                    # Too large for memory, or would be evicted by the rest of the batch - drop any stale copy
+                    self._discard_from_memory(key)
+                    if size <= self._max_item_size_bytes:
+                        # Skipped by the batch trim, counted as if it had been inserted and evicted
+                        self._stats_memory_evictions += 1
 
-        # Update statistics - each item counts as a separate put
-        self._stats_total_puts += len(items)
+            # Evict from memory if needed
+            self._evict_from_memory_by_count()
+            self._evict_from_memory_by_size()
+
+            # Evict from disk if needed
+            self._evict_from_disk_by_count()
+            self._evict_from_disk_by_size()
+
+            # Update statistics - each item counts as a separate put
+            self._stats_total_puts += len(items)
 
     def get_many(self, keys: list[str], timestamp: Optional[float] = None) -> dict[str, CacheableModel]:
         """Retrieve multiple items from cache.
@@ -546,208 +715,225 @@ class DiskBackedCache:
         Returns dictionary of found items only (missing keys omitted).
         Does not update access timestamps.
         """
-        logger.log(TRACE, f"get_many(count={len(keys)})")
-        # Validate all keys first
-        for key in keys:
-            self._validate_key(key)
-
-        result: dict[str, CacheableModel] = {}
+        with self._lock:
+            logger.log(TRACE, "get_many(count=%d)", len(keys))
+            # Validate all keys first
+            validate_key = self._validate_key
+            for key in keys:
+                validate_key(key)
 
-        # Get current timestamp if not provided
-        if timestamp is None:
-            timestamp = time.time()
+            result: dict[str, CacheableModel] = {}
 
-        # Process each key
-        for key in keys:
-            # Increment total_gets for each key
-            self._stats_total_gets += 1
+            # Get current timestamp if not provided
+            if timestamp is None:
+                timestamp = time.time()
 
-            # Check memory first
-            if key in self._memory_cache:
-                # Check memory TTL
-                memory_timestamp = self._memory_timestamps[key]
-                if timestamp - memory_timestamp > self._memory_ttl_seconds:
-                    # Expired - remove from memory and continue to disk check
-                    obj_size = self._calculate_size(self._memory_cache[key])
-                    del self._memory_cache[key]
-                    del self._memory_timestamps[key]
-                    self._memory_item_count -= 1
-                    self._memory_total_size -= obj_size
-                else:
-                    # Not expired
-                    result[key] = self._memory_cache[key]
-                    self._stats_memory_hits += 1
+            # Check memory first, collecting the keys that need a disk lookup
+            disk_keys: list[str] = []
+            for key in keys:
+                # Increment total_gets for each key
+                self._stats_total_gets += 1
+
+                memory_entry = self._memory_cache.get(key)
+                if memory_entry is not None:
+                    # Check memory TTL
+                    cached_obj, _, memory_timestamp = memory_entry
+                    if timestamp - memory_timestamp > self._memory_ttl_seconds:
+                        # Expired - remove from memory and continue to disk check
+                        self._discard_from_memory(key)
+                    else:
+                        # Not expired
+                        result[key] = cached_obj
+                        self._stats_memory_hits += 1
+                        continue
+
+                disk_keys.append(key)
+
+            # Fetch all remaining keys from disk at once
+            disk_rows: dict[str, tuple[Any, ...]] = {}
+            if disk_keys:
+                unique_keys = list(dict.fromkeys(disk_keys))
+                disk_rows = {row[0]: row[1:] for row in self._execute_in_list(_SQL_SELECT_ENTRIES_IN, unique_keys)}
+
+            for key in disk_keys:
+                # A row deleted below (expired, stale schema, corrupt) is a miss for any repeat of its key
+                row = disk_rows.get(key)
+
+                if row is None:
+                    self._stats_misses += 1
                     continue
 
-            # Check disk
-            cursor = self._conn.execute(
-                "SELECT value, schema_version, timestamp FROM cache WHERE key = ?",
-                (key,),
-            )
-            row = cursor.fetchone()
-
-            if row is None:
-                self._stats_misses += 1
-                continue
-
-            value_json, stored_schema_version, disk_timestamp = row
+                value_json, stored_schema_version, disk_timestamp, disk_size = row
+                disk_timestamp = self._pending_timestamp_updates.get(key, disk_timestamp)
 
-            # Check disk TTL
-            if timestamp - disk_timestamp > self._disk_ttl_seconds:
-                # Expired - delete and count as miss
-                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
-                self._conn.commit()
-                self._stats_misses += 1
-                continue
+                # Check disk TTL
+                if timestamp - disk_timestamp > self._disk_ttl_seconds:
+                    # Expired - delete and count as miss
+                    self._delete_from_disk(key, disk_size)
+                    del disk_rows[key]
+                    self._stats_misses += 1
+                    continue
 
-            # Validate schema version
-            if stored_schema_version != self._schema_version:
-                # Schema mismatch - delete and count as miss
-                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
-                self._conn.commit()
-                self._stats_misses += 1
-                continue
+                # Validate schema version
+                if stored_schema_version != self._schema_version:
+                    # Schema mismatch - delete and count as miss
+                    self._delete_from_disk(key, disk_size)
+                    del disk_rows[key]
+                    self._stats_misses += 1
+                    continue
 
-            # Deserialize
-            try:
-                obj = self._deserialize(value_json)
-            except ValueError:
-                # Deserialization failed - delete and count as miss
-                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
-                self._conn.commit()
-                self._stats_misses += 1
-                continue
+                # Deserialize
+                try:
+                    obj = self._deserialize(value_json)
+                except ValueError:
+                    # Deserialization failed - delete and count as miss
+                    self._delete_from_disk(key, disk_size)
+                    del disk_rows[key]
+                    self._stats_misses += 1
+                    continue
 
-            # Add to result (but don't update timestamp or promote to memory)
-            result[key] = obj
-            self._stats_disk_hits += 1
+                # Add to result (but don't update timestamp or promote to memory)
+                result[key] = obj
+                self._stats_disk_hits += 1
 
-        return result
+            return result
 
     def delete_many(self, keys: list[str]) -> None:
         """Remove multiple items from cache.
 
         Non-existent keys are silently ignored. All deletes are atomic.
         """
-        logger.log(TRACE, f"delete_many(count={len(keys)})")
-        # Validate all keys first
-        for key in keys:
-            self._validate_key(key)
-
-        # Remove from memory first
-        for key in keys:
-            if key in self._memory_cache:
-                obj_size = self._calculate_size(self._memory_cache[key])
-                del self._memory_cache[key]
-                del self._memory_timestamps[key]
-                self._memory_item_count -= 1
-                self._memory_total_size -= obj_size
+        with self._lock:
+            logger.log(TRACE, "delete_many(count=%d)", len(keys))
+            # Validate all keys first
+            validate_key = self._validate_key
+            for key in keys:
+                validate_key(key)
 
-        # Remove from disk in a single transaction
-        try:
-            # Begin transaction explicitly
-            self._conn.execute("BEGIN")
+            # Remove from memory first
+            for key in keys:
+                self._discard_from_memory(key)
 
             for key in keys:
-                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self._pending_timestamp_updates.pop(key, None)
 
-            # Commit transaction
-            self._conn.commit()
-        except Exception:
-            # Rollback on error (memory changes can't be rolled back)
-            self._conn.rollback()
-            raise
+            # Remove from disk in a single transaction
+            try:
+                # Begin transaction explicitly, taking the write lock up front
+                self._conn.execute("BEGIN IMMEDIATE")
+
+                unique_keys = list(dict.fromkeys(keys))
+                if _SQLITE_HAS_RETURNING:
+                    deleted_sizes = dict(self._execute_in_list(_SQL_DELETE_IN_RETURNING, unique_keys))
+                else:
+                    deleted_sizes = self._disk_sizes_of(unique_keys)
+                    self._execute_in_list(_SQL_DELETE_IN, list(deleted_sizes))
+                count_delta = len(deleted_sizes)
+                size_delta = sum(deleted_sizes.values())
 
-        # Update statistics - each key counts as a separate delete
-        self._stats_total_deletes += len(keys)
+                # Commit transaction
+                self._conn.commit()
+            except Exception:
+                # Rollback on error (memory changes can't be rolled back)
+                self._conn.rollback()
+                raise
+
+            self._subtract_from_disk_counters(count_delta, size_delta)
+
+            # Update statistics - each key counts as a separate delete
+            self._stats_total_deletes += len(keys)
 
     def delete(self, key: str) -> None:
         """Remove item from both memory and disk cache."""
-        self._validate_key(key)
-        logger.log(TRACE, f"delete(key={key!r})")
-        self._stats_total_deletes += 1
-
-        # Remove from memory if present
-        if key in self._memory_cache:
-            obj_size = self._calculate_size(self._memory_cache[key])
-            del self._memory_cache[key]
-            del self._memory_timestamps[key]
-            self._memory_item_count -= 1
-            self._memory_total_size -= obj_size
-
-        # Remove from disk
-        self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
-        self._conn.commit()
+        with self._lock:
+            self._validate_key(key)
+            logger.log(TRACE, "delete(key=%r)", key)
+            self._stats_total_deletes += 1
+
+            # Remove from memory if present
+            self._discard_from_memory(key)
+
+            # Remove from disk
+            self._pending_timestamp_updates.pop(key, None)
+            self._pop_from_disk(key)
 
     def get_total_size(self) -> int:
         """Get total size of items in cache (from disk)."""
-        # Get disk total size
-        cursor = self._conn.execute("SELECT SUM(size) FROM cache")
-        result = cursor.fetchone()[0]
-
-        # Return 0 if no items (SUM returns None for empty table)
-        return result if result is not None else 0
+        with self._lock:
+            # Read from the table: other connections to the same database file change it too
+            self._sync_disk_counters()
+            return self._disk_total_size
 
     def get_count(self) -> int:
         """Get total count of unique items in cache (memory + disk)."""
-        # Get disk count
-        cursor = self._conn.execute("SELECT COUNT(*) FROM cache")
-        disk_count = cursor.fetchone()[0]
-
         # Items in memory are also on disk, so we just return disk count
         # (which represents the total unique items)
-        return disk_count
+        with self._lock:
+            # Read from the table: other connections to the same database file change it too
+            self._sync_disk_counters()
+            return self._disk_count
 
     def clear(self) -> None:
         """Remove all items from cache (both memory and disk)."""
-        logger.log(TRACE, "clear()")
-        # Clear memory
-        self._memory_cache.clear()
-        self._memory_timestamps.clear()
-        self._memory_item_count = 0
-        self._memory_total_size = 0
-
-        # Clear disk
-        self._conn.execute("DELETE FROM cache")
-        self._conn.commit()
+        with self._lock:
+            logger.log(TRACE, "clear()")
+            # Clear memory
+            self._memory_cache.clear()
+            self._memory_lru_ordered = True
+            self._memory_total_size = 0
+
+            # Clear disk
+            self._pending_timestamp_updates.clear()
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+            self._disk_count = 0
+            self._disk_total_size = 0
 
     def exists(self, key: str, timestamp: Optional[float] = None) -> bool:
         """Check if key exists in cache (memory or disk)."""
-        self._validate_key(key)
-        logger.log(TRACE, f"exists(key={key!r})")
+        with self._lock:
+            self._validate_key(key)
+            logger.log(TRACE, "exists(key=%r)", key)
 
-        # Check memory first
-        if key in self._memory_cache:
-            return True
+            # Check memory first
+            if key in self._memory_cache:
+                return True
 
-        # Check disk
-        cursor = self._conn.execute(
-            "SELECT COUNT(*) FROM cache WHERE key = ?",
-            (key,),
-        )
-        count = cursor.fetchone()[0]
-        return count > 0
+            # Check disk (answered from the primary key index alone)
+            cursor = self._lookup_cursor.execute(_SQL_EXISTS, (key,))
+            return cursor.fetchone() is not None
 
     def get_stats(self) -> dict[str, int]:
         """Get cache statistics."""
-        # Get current disk count
-        cursor = self._conn.execute("SELECT COUNT(*) FROM cache")
-        disk_count = cursor.fetchone()[0]
-
-        return {
-            "memory_hits": self._stats_memory_hits,
-            "disk_hits": self._stats_disk_hits,
-            "misses": self._stats_misses,
-            "memory_evictions": self._stats_memory_evictions,
-            "disk_evictions": self._stats_disk_evictions,
-            "total_puts": self._stats_total_puts,
-            "total_gets": self._stats_total_gets,
-            "total_deletes": self._stats_total_deletes,
-            "current_memory_items": self._memory_item_count,
-            "current_disk_items": disk_count,
-        }
+        with self._lock:
+            self._flush_timestamp_updates()
+            self._sync_disk_counters()
+
+            return {
+                "memory_hits": self._stats_memory_hits,
+                "disk_hits": self._stats_disk_hits,
+                "misses": self._stats_misses,
+                "memory_evictions": self._stats_memory_evictions,
+                "disk_evictions": self._stats_disk_evictions,
+                "total_puts": self._stats_total_puts,
+                "total_gets": self._stats_total_gets,
+                "total_deletes": self._stats_total_deletes,
+                "current_memory_items": len(self._memory_cache),
+                "current_disk_items": self._disk_count,
+            }
 
     def close(self) -> None:
         """Close the database connection."""
-        if hasattr(self, "_conn"):
-            self._conn.close()
+        if not hasattr(self, "_conn"):
+            return
+        with self._lock:
+            # Later calls are no-ops
+            if self._closed:
+                return
+            self._closed = True
+            try:
+                self._flush_timestamp_updates()
+                # Let SQLite refresh query planner statistics before closing
+                self._conn.execute("PRAGMA optimize")
+            finally:
+                self._conn.close()
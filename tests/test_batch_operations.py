@@ -2,6 +2,7 @@
 
 import pytest
 
+from disk_backed_cache_example import disk_backed_cache
 from disk_backed_cache_example.disk_backed_cache import CacheableModel, DiskBackedCache
 
 
@@ -184,6 +185,33 @@ def test_put_many_uses_same_timestamp(db_path: str) -> None:
     cache.close()
 
 
+def test_put_many_writes_in_a_single_transaction(db_path: str) -> None:
+    """put_many() should write the whole batch in one transaction with one commit."""
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=BatchModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    statements: list[str] = []
+    cache._conn.set_trace_callback(statements.append)  # type: ignore[attr-defined]
+
+    cache.put_many({f"key{i}": BatchModel(value=i) for i in range(5)})
+
+    cache._conn.set_trace_callback(None)  # type: ignore[attr-defined]
+    assert [s for s in statements if s.startswith(("BEGIN", "COMMIT"))] == ["BEGIN IMMEDIATE", "COMMIT"]
+    assert sum(s.startswith("INSERT") for s in statements) == 5
+    assert cache.get_count() == 5
+
+    cache.close()
+
+
 def test_put_many_updates_memory_and_disk(db_path: str) -> None:
     """put_many() should store items in both memory and disk."""
     cache = DiskBackedCache(
@@ -210,8 +238,7 @@ def test_put_many_updates_memory_and_disk(db_path: str) -> None:
     assert "key2" in cache._memory_cache  # type: ignore[attr-defined]
 
     # Check disk
-    cursor = cache._conn.execute("SELECT COUNT(*) FROM cache")  # type: ignore[attr-defined]
-    assert cursor.fetchone()[0] == 2
+    assert cache.get_stats()["current_disk_items"] == 2
 
     cache.close()
 
@@ -441,11 +468,6 @@ def test_get_many_checks_memory_first(db_path: str) -> None:
     cache.put("key1", BatchModel(value=1))
     cache.put("key2", BatchModel(value=2))
 
-    # Reset stats
-    cache._stats_memory_hits = 0  # type: ignore[attr-defined]
-    cache._stats_disk_hits = 0  # type: ignore[attr-defined]
-    cache._stats_total_gets = 0  # type: ignore[attr-defined]
-
     # Retrieve with get_many
     cache.get_many(["key1", "key2"])
 
@@ -478,12 +500,6 @@ def test_get_many_checks_disk_if_not_in_memory(db_path: str) -> None:
 
     # Clear memory
     cache._memory_cache.clear()  # type: ignore[attr-defined]
-    cache._memory_item_count = 0  # type: ignore[attr-defined]
-
-    # Reset stats
-    cache._stats_memory_hits = 0  # type: ignore[attr-defined]
-    cache._stats_disk_hits = 0  # type: ignore[attr-defined]
-    cache._stats_total_gets = 0  # type: ignore[attr-defined]
 
     # Retrieve with get_many
     result = cache.get_many(["key1", "key2"])
@@ -498,6 +514,63 @@ def test_get_many_checks_disk_if_not_in_memory(db_path: str) -> None:
     cache.close()
 
 
+def test_get_many_reads_disk_items_with_one_query(db_path: str) -> None:
+    """get_many() should look up all keys missing from memory with a single disk query."""
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=BatchModel,
+        max_memory_items=1,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    cache.put("key1", BatchModel(value=1), timestamp=1000.0)
+    cache.put("key2", BatchModel(value=2), timestamp=1001.0)
+    cache.put("key3", BatchModel(value=3), timestamp=1002.0)
+
+    statements: list[str] = []
+    cache._conn.set_trace_callback(statements.append)  # type: ignore[attr-defined]
+
+    result = cache.get_many(["key1", "key2", "key3", "missing"], timestamp=1003.0)
+
+    cache._conn.set_trace_callback(None)  # type: ignore[attr-defined]
+    assert result == {"key1": BatchModel(value=1), "key2": BatchModel(value=2), "key3": BatchModel(value=3)}
+    assert sum(s.startswith("SELECT") for s in statements) == 1
+
+    cache.close()
+
+
+def test_get_many_expired_duplicate_key_is_deleted_once(db_path: str) -> None:
+    """A key expired on disk and requested twice should be removed once and count as two misses."""
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=BatchModel,
+        max_memory_items=1,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    cache.put("key1", BatchModel(value=1), timestamp=1000.0)
+    cache.put("key2", BatchModel(value=2), timestamp=5000.0)
+
+    result = cache.get_many(["key1", "key1"], timestamp=5000.0)
+
+    assert result == {}
+    assert cache.get_count() == 1
+    assert cache.get_total_size() == len(BatchModel(value=2).model_dump_json())
+    assert cache.get_stats()["misses"] == 2
+
+    cache.close()
+
+
 def test_get_many_increments_total_gets(db_path: str) -> None:
     """get_many() should increment total_gets by number of keys."""
     cache = DiskBackedCache(
@@ -516,9 +589,6 @@ def test_get_many_increments_total_gets(db_path: str) -> None:
     cache.put("key1", BatchModel(value=1))
     cache.put("key2", BatchModel(value=2))
 
-    # Reset stats
-    cache._stats_total_gets = 0  # type: ignore[attr-defined]
-
     # Retrieve with get_many
     cache.get_many(["key1", "key2", "key3"])  # key3 doesn't exist
 
@@ -549,12 +619,6 @@ def test_get_many_updates_hit_miss_counters(db_path: str) -> None:
     # Clear memory for key2
     del cache._memory_cache["key2"]  # type: ignore[attr-defined]
 
-    # Reset stats
-    cache._stats_memory_hits = 0  # type: ignore[attr-defined]
-    cache._stats_disk_hits = 0  # type: ignore[attr-defined]
-    cache._stats_misses = 0  # type: ignore[attr-defined]
-    cache._stats_total_gets = 0  # type: ignore[attr-defined]
-
     # Retrieve with get_many
     cache.get_many(["key1", "key2", "key3"])
 
@@ -759,8 +823,7 @@ def test_delete_many_removes_from_memory_and_disk(db_path: str) -> None:
     # Verify they're in both memory and disk
     assert "key1" in cache._memory_cache  # type: ignore[attr-defined]
     assert "key2" in cache._memory_cache  # type: ignore[attr-defined]
-    cursor = cache._conn.execute("SELECT COUNT(*) FROM cache")  # type: ignore[attr-defined]
-    assert cursor.fetchone()[0] == 2
+    assert cache.get_stats()["current_disk_items"] == 2
 
     # Delete with delete_many
     cache.delete_many(["key1", "key2"])
@@ -768,8 +831,42 @@ def test_delete_many_removes_from_memory_and_disk(db_path: str) -> None:
     # Should be removed from both
     assert "key1" not in cache._memory_cache  # type: ignore[attr-defined]
     assert "key2" not in cache._memory_cache  # type: ignore[attr-defined]
-    cursor = cache._conn.execute("SELECT COUNT(*) FROM cache")  # type: ignore[attr-defined]
-    assert cursor.fetchone()[0] == 0
+    assert cache.get_stats()["current_disk_items"] == 0
+
+    cache.close()
+
+
+@pytest.mark.parametrize("has_returning", [True, False])
+def test_delete_many_uses_one_delete_statement(
+    db_path: str, monkeypatch: pytest.MonkeyPatch, has_returning: bool
+) -> None:
+    """delete_many() should remove all disk rows with a single DELETE and keep the counters in sync."""
+    monkeypatch.setattr(disk_backed_cache, "_SQLITE_HAS_RETURNING", has_returning)
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=BatchModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    cache.put("key1", BatchModel(value=1))
+    cache.put("key2", BatchModel(value=2))
+    cache.put("key3", BatchModel(value=3))
+
+    statements: list[str] = []
+    cache._conn.set_trace_callback(statements.append)  # type: ignore[attr-defined]
+
+    cache.delete_many(["key1", "key2", "key2", "missing"])
+
+    cache._conn.set_trace_callback(None)  # type: ignore[attr-defined]
+    assert sum(s.startswith("DELETE") for s in statements) == 1
+    assert cache.get_count() == 1
+    assert cache.get_total_size() == len(BatchModel(value=3).model_dump_json())
 
     cache.close()
 
@@ -793,9 +890,6 @@ def test_delete_many_increments_total_deletes(db_path: str) -> None:
     cache.put("key2", BatchModel(value=2))
     cache.put("key3", BatchModel(value=3))
 
-    # Reset stats
-    cache._stats_total_deletes = 0  # type: ignore[attr-defined]
-
     # Delete with delete_many
     cache.delete_many(["key1", "key2", "key3"])
 
@@ -925,3 +1019,110 @@ def test_delete_many_mixed_keys(db_path: str) -> None:
     assert cache.get_count() == 0
 
     cache.close()
+
+
+def test_put_many_and_delete_many_with_large_batch(db_path: str) -> None:
+    """Batches larger than one key lookup chunk should keep count and size tracking accurate."""
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=BatchModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=2000,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    cache.put_many({f"key{i}": BatchModel(value=i) for i in range(1200)})
+    assert cache.get_count() == 1200
+
+    # Overwrite half of them in another batch
+    cache.put_many({f"key{i}": BatchModel(value=i) for i in range(600)})
+    assert cache.get_count() == 1200
+
+    cache.delete_many([f"key{i}" for i in range(1000)])
+    assert cache.get_count() == 200
+    assert cache.get_total_size() == sum(len(BatchModel(value=i).model_dump_json()) for i in range(1000, 1200))
+
+    cache.close()
+
+
+def test_delete_many_with_duplicate_keys(db_path: str) -> None:
+    """Duplicate keys in delete_many() should only be removed once from tracking."""
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=BatchModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    cache.put_many({"key1": BatchModel(value=1), "key2": BatchModel(value=2)})
+
+    cache.delete_many(["key1", "key1"])
+
+    assert cache.get_count() == 1
+    assert cache.get_total_size() == len(BatchModel(value=2).model_dump_json())
+
+    cache.close()
+
+
+def test_put_many_larger_than_memory_keeps_most_recent_items(db_path: str) -> None:
+    """A batch bigger than memory keeps only the items LRU eviction would keep, and counts the rest as evicted."""
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=BatchModel,
+        max_memory_items=5,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=1000,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    cache.put("existing", BatchModel(value=-1), timestamp=1000.0)
+    cache.put_many({f"key{i:03d}": BatchModel(value=i) for i in range(100)}, timestamp=2000.0)
+
+    # Same timestamp for the batch: alphabetically largest keys are the most recently used
+    assert set(cache._memory_cache) == {f"key{i:03d}" for i in range(95, 100)}  # type: ignore[attr-defined]
+    assert cache._memory_total_size == sum(  # type: ignore[attr-defined]
+        len(BatchModel(value=i).model_dump_json()) for i in range(95, 100)
+    )
+    assert cache.get_stats()["memory_evictions"] == 96
+    assert cache.get_count() == 101
+    assert cache.get("key000", timestamp=2000.0) == BatchModel(value=0)
+
+    cache.close()
+
+
+def test_put_many_over_memory_size_evicts_older_entries_first(db_path: str) -> None:
+    """A batch that overflows memory by size should evict older entries before any batch item."""
+    small_size = len(BatchModel(value=1).model_dump_json())
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=BatchModel,
+        max_memory_items=10,
+        max_memory_size_bytes=2 * small_size + 4,
+        max_disk_items=100,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    cache.put("x", BatchModel(value=1), timestamp=1000.0)
+    # "a" (larger) and "b" do not fit together; "b" is the most recently used of the batch
+    cache.put_many({"a": BatchModel(value=1_000_000_000), "b": BatchModel(value=2)}, timestamp=2000.0)
+
+    assert list(cache._memory_cache) == ["b"]  # type: ignore[attr-defined]
+    assert cache._memory_total_size == small_size  # type: ignore[attr-defined]
+    assert cache.get_stats()["memory_evictions"] == 2
+
+    cache.close()
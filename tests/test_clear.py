@@ -25,9 +25,7 @@ def test_clear_removes_all_items_from_memory(db_path: str) -> None:
     )
 
     # Add items
-    cache.put("key1", ClearModel(value=1))
-    cache.put("key2", ClearModel(value=2))
-    cache.put("key3", ClearModel(value=3))
+    cache.put_many({"key1": ClearModel(value=1), "key2": ClearModel(value=2), "key3": ClearModel(value=3)})
 
     # Verify items are in memory
     assert "key1" in cache._memory_cache  # type: ignore[attr-defined]
@@ -39,7 +37,6 @@ def test_clear_removes_all_items_from_memory(db_path: str) -> None:
 
     # Memory should be empty
     assert len(cache._memory_cache) == 0  # type: ignore[attr-defined]
-    assert len(cache._memory_timestamps) == 0  # type: ignore[attr-defined]
 
     cache.close()
 
@@ -59,9 +56,7 @@ def test_clear_removes_all_items_from_disk(db_path: str) -> None:
     )
 
     # Add items
-    cache.put("key1", ClearModel(value=1))
-    cache.put("key2", ClearModel(value=2))
-    cache.put("key3", ClearModel(value=3))
+    cache.put_many({"key1": ClearModel(value=1), "key2": ClearModel(value=2), "key3": ClearModel(value=3)})
 
     # Verify items are on disk
     assert cache.get_count() == 3
@@ -71,11 +66,11 @@ def test_clear_removes_all_items_from_disk(db_path: str) -> None:
 
     # Disk should be empty
     assert cache.get_count() == 0
+    cursor = cache._conn.execute("SELECT COUNT(*) FROM cache")  # type: ignore[attr-defined]
+    assert cursor.fetchone()[0] == 0
 
     # Items should not be retrievable
-    assert cache.get("key1") is None
-    assert cache.get("key2") is None
-    assert cache.get("key3") is None
+    assert cache.get_many(["key1", "key2", "key3"]) == {}
 
     cache.close()
 
@@ -95,8 +90,7 @@ def test_clear_resets_counts(db_path: str) -> None:
     )
 
     # Add items
-    cache.put("key1", ClearModel(value=1))
-    cache.put("key2", ClearModel(value=2))
+    cache.put_many({"key1": ClearModel(value=1), "key2": ClearModel(value=2)})
 
     stats_before = cache.get_stats()
     assert stats_before["current_memory_items"] == 2
@@ -154,23 +148,19 @@ def test_operations_after_clear(db_path: str) -> None:
     )
 
     # Add items
-    cache.put("key1", ClearModel(value=1))
-    cache.put("key2", ClearModel(value=2))
+    cache.put_many({"key1": ClearModel(value=1), "key2": ClearModel(value=2)})
 
     # Clear
     cache.clear()
 
     # Add new items
-    cache.put("key3", ClearModel(value=3))
-    cache.put("key4", ClearModel(value=4))
+    cache.put_many({"key3": ClearModel(value=3), "key4": ClearModel(value=4)})
 
-    # New items should be retrievable
-    assert cache.get("key3") == ClearModel(value=3)
-    assert cache.get("key4") == ClearModel(value=4)
-
-    # Old items should not be retrievable
-    assert cache.get("key1") is None
-    assert cache.get("key2") is None
+    # Only the new items should be retrievable
+    assert cache.get_many(["key1", "key2", "key3", "key4"]) == {
+        "key3": ClearModel(value=3),
+        "key4": ClearModel(value=4),
+    }
 
     # Count should be 2
     assert cache.get_count() == 2
@@ -193,8 +183,7 @@ def test_clear_does_not_affect_statistics(db_path: str) -> None:
     )
 
     # Add items
-    cache.put("key1", ClearModel(value=1))
-    cache.put("key2", ClearModel(value=2))
+    cache.put_many({"key1": ClearModel(value=1), "key2": ClearModel(value=2)})
 
     # Get items (to increment hit counters)
     cache.get("key1")
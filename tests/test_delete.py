@@ -1,3 +1,6 @@
+import pytest
+
+from disk_backed_cache_example import disk_backed_cache
 from disk_backed_cache_example.disk_backed_cache import CacheableModel, DiskBackedCache
 
 
@@ -65,12 +68,11 @@ def test_delete_removes_from_sqlite(db_path: str) -> None:
     cache.put("key1", obj)
 
     # Verify it's in SQLite
-    cursor = cache._conn.execute("SELECT key FROM cache WHERE key = ?", ("key1",))
-    assert cursor.fetchone() is not None
+    assert cache.get_count() == 1
 
     cache.delete("key1")
 
-    # Verify it's removed from SQLite
+    # Verify the row itself is gone, not just the running count
     cursor = cache._conn.execute("SELECT key FROM cache WHERE key = ?", ("key1",))
     assert cursor.fetchone() is None
 
@@ -95,8 +97,7 @@ def test_delete_from_both_memory_and_disk(db_path: str) -> None:
 
     # Verify it's in both
     assert "key1" in cache._memory_cache
-    cursor = cache._conn.execute("SELECT key FROM cache WHERE key = ?", ("key1",))
-    assert cursor.fetchone() is not None
+    assert cache.get_count() == 1
 
     cache.delete("key1")
 
@@ -110,3 +111,31 @@ def test_delete_from_both_memory_and_disk(db_path: str) -> None:
     assert result is None
 
     cache.close()
+
+
+@pytest.mark.parametrize("has_returning", [True, False])
+def test_delete_updates_counters(db_path: str, monkeypatch: pytest.MonkeyPatch, has_returning: bool) -> None:
+    """delete() should lower the disk count and size only for keys that were on disk."""
+    monkeypatch.setattr(disk_backed_cache, "_SQLITE_HAS_RETURNING", has_returning)
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=SampleModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    cache.put("key1", SampleModel(name="first"))
+    cache.put("key2", SampleModel(name="second"))
+
+    cache.delete("key1")
+    cache.delete("missing")
+
+    assert cache.get_count() == 1
+    assert cache.get_total_size() == len(SampleModel(name="second").model_dump_json())
+
+    cache.close()
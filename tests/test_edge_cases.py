@@ -83,8 +83,7 @@ def test_delete_nonexistent_key(db_path: str) -> None:
     )
 
     # Add some items
-    cache.put("key1", EdgeModel(value=1))
-    cache.put("key2", EdgeModel(value=2))
+    cache.put_many({"key1": EdgeModel(value=1), "key2": EdgeModel(value=2)})
 
     # Delete nonexistent key (should not error)
     cache.delete("key999")
@@ -170,7 +169,7 @@ def test_put_when_exactly_at_size_limit(db_path: str) -> None:
 
     # key1 should be evicted from memory (but still on disk)
     # key4 should be in memory
-    assert cache._memory_item_count <= 3  # type: ignore[attr-defined]
+    assert len(cache._memory_cache) <= 3  # type: ignore[attr-defined]
 
     cache.close()
 
@@ -25,12 +25,12 @@ def test_memory_evicts_oldest_on_count_limit(db_path: str) -> None:
     cache.put("key3", SampleModel(name="test3"), timestamp=3.0)
 
     # All 3 should be in memory
-    assert cache._memory_count == 3
+    assert len(cache._memory_cache) == 3
 
     # Add one more - should evict oldest (key1)
     cache.put("key4", SampleModel(name="test4"), timestamp=4.0)
 
-    assert cache._memory_count == 3
+    assert len(cache._memory_cache) == 3
     assert "key1" not in cache._memory_cache
     assert "key2" in cache._memory_cache
     assert "key3" in cache._memory_cache
@@ -87,7 +87,7 @@ def test_memory_eviction_makes_room_for_new(db_path: str) -> None:
 
     # Should have room for new item
     assert "new_key" in cache._memory_cache
-    assert cache._memory_count == 3
+    assert len(cache._memory_cache) == 3
 
     cache.close()
 
@@ -133,7 +133,7 @@ def test_memory_evicts_multiple_for_large_item(db_path: str) -> None:
     cache.put("key2", SampleModel(name="b"), timestamp=2.0)
     cache.put("key3", SampleModel(name="c"), timestamp=3.0)
 
-    initial_count = cache._memory_count
+    initial_count = len(cache._memory_cache)
 
     # Add larger item - may evict multiple
     cache.put("large", SampleModel(name="x" * 100), timestamp=4.0)
@@ -141,7 +141,7 @@ def test_memory_evicts_multiple_for_large_item(db_path: str) -> None:
     # Should maintain size limit
     assert cache._memory_total_size <= 150
     # May have evicted items
-    assert cache._memory_count <= initial_count
+    assert len(cache._memory_cache) <= initial_count
 
     cache.close()
 
@@ -317,3 +317,34 @@ def test_disk_eviction_removes_from_memory(db_path: str) -> None:
     assert cursor.fetchone() is None
 
     cache.close()
+
+
+def test_memory_size_tracking_after_overwrite_and_delete(db_path: str) -> None:
+    """Memory size total should follow overwrites, disk promotions and deletes."""
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=SampleModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    cache.put("key1", SampleModel(name="a"))
+    cache.put("key2", SampleModel(name="b"))
+    cache.put("key1", SampleModel(name="a much longer name"))
+    cache.get("key2")
+
+    expected = len(SampleModel(name="a much longer name").model_dump_json()) + len(
+        SampleModel(name="b").model_dump_json()
+    )
+    assert cache._memory_total_size == expected
+
+    cache.delete("key1")
+    cache.delete_many(["key2"])
+    assert cache._memory_total_size == 0
+
+    cache.close()
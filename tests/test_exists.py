@@ -1,5 +1,7 @@
 """Tests for exists/contains check."""
 
+import pytest
+
 from disk_backed_cache_example.disk_backed_cache import CacheableModel, DiskBackedCache
 
 
@@ -75,3 +77,39 @@ def test_exists_returns_false_when_not_found(db_path: str) -> None:
     assert cache.exists("nonexistent") is False
 
     cache.close()
+
+
+def test_exists_sees_items_written_by_another_instance(db_path: str, request: pytest.FixtureRequest) -> None:
+    """exists() should find an item another cache instance wrote to the same database file."""
+    if request.config.getoption("--db-mode") == "memory":
+        pytest.skip("Test requires a shared database file")
+
+    reader = DiskBackedCache(
+        db_path=db_path,
+        model=ExampleModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+    writer = DiskBackedCache(
+        db_path=db_path,
+        model=ExampleModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    writer.put("key1", ExampleModel(value="shared"))
+
+    assert reader.exists("key1") is True
+
+    writer.close()
+    reader.close()
@@ -116,3 +116,29 @@ def test_non_string_key_raises_typeerror(db_path: str) -> None:
         cache.get(456)  # type: ignore[arg-type]
 
     cache.close()
+
+
+def test_str_subclass_key_is_accepted(db_path: str) -> None:
+    """Keys that are instances of a str subclass should be accepted."""
+
+    class KeyStr(str):
+        pass
+
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=SampleModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    obj = SampleModel(data="test")
+    cache.put(KeyStr("key1"), obj)
+
+    assert cache.get("key1") == obj
+
+    cache.close()
@@ -162,7 +162,6 @@ def test_disk_hit_logs(db_path: str, caplog: "pytest.LogCaptureFixture") -> None
 
     # Remove from memory to force disk hit
     cache._memory_cache.clear()  # type: ignore[attr-defined]
-    cache._memory_timestamps.clear()  # type: ignore[attr-defined]
 
     # Capture TRACE level logs
     with caplog.at_level(TRACE, logger="disk_backed_cache_example.disk_backed_cache"):
@@ -280,7 +279,6 @@ def test_schema_mismatch_logs(db_path: str, caplog: "pytest.LogCaptureFixture")
 
     # Remove from memory to force disk read
     cache_v2._memory_cache.clear()  # type: ignore[attr-defined]
-    cache_v2._memory_timestamps.clear()  # type: ignore[attr-defined]
 
     # Capture TRACE level logs
     with caplog.at_level(TRACE, logger="disk_backed_cache_example.disk_backed_cache"):
@@ -2,6 +2,9 @@
 
 import time
 
+import pytest
+
+from disk_backed_cache_example import disk_backed_cache
 from disk_backed_cache_example.disk_backed_cache import CacheableModel, DiskBackedCache
 
 
@@ -149,6 +152,34 @@ def test_memory_eviction_tie_breaking_alphabetical(db_path: str) -> None:
     cache.close()
 
 
+def test_memory_eviction_uses_timestamps_when_inserted_out_of_order(db_path: str) -> None:
+    """Memory eviction should follow timestamps, not insertion order."""
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=EvictionModel,
+        max_memory_items=2,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    # Insert the newer item first
+    cache.put("key2", EvictionModel(value=2), timestamp=2000.0)
+    cache.put("key1", EvictionModel(value=1), timestamp=1000.0)
+
+    # Add 3rd item (should evict key1 - oldest timestamp)
+    cache.put("key3", EvictionModel(value=3), timestamp=3000.0)
+
+    assert "key1" not in cache._memory_cache  # type: ignore[attr-defined]
+    assert "key2" in cache._memory_cache  # type: ignore[attr-defined]
+    assert "key3" in cache._memory_cache  # type: ignore[attr-defined]
+
+    cache.close()
+
+
 def test_memory_eviction_multiple_items(db_path: str) -> None:
     """Should evict multiple items if needed to get under limit."""
     cache = DiskBackedCache(
@@ -591,6 +622,93 @@ def test_disk_eviction_cascades_to_memory(db_path: str) -> None:
     cache.close()
 
 
+def test_disk_eviction_respects_access_time_from_memory_hit(db_path: str) -> None:
+    """A memory hit should refresh the item's disk access time for disk LRU."""
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=EvictionModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=2,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    cache.put("key1", EvictionModel(value=1), timestamp=1000.0)
+    cache.put("key2", EvictionModel(value=2), timestamp=1001.0)
+
+    # Memory hit makes key1 the most recently used
+    cache.get("key1", timestamp=1002.0)
+
+    # Add 3rd item (should evict key2 from disk)
+    cache.put("key3", EvictionModel(value=3), timestamp=1003.0)
+
+    assert cache.get("key2", timestamp=1004.0) is None
+    assert cache.get("key1", timestamp=1004.0) == EvictionModel(value=1)
+
+    cache.close()
+
+
+def test_put_without_eviction_keeps_access_times_buffered(db_path: str) -> None:
+    """Buffered access times are only written when disk eviction needs them (or on flush)."""
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=EvictionModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=10,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    cache.put("key1", EvictionModel(value=1), timestamp=1000.0)
+    cache.get("key1", timestamp=1002.0)
+    cache.put("key2", EvictionModel(value=2), timestamp=1003.0)
+
+    assert cache._pending_timestamp_updates == {"key1": 1002.0}  # type: ignore[attr-defined]
+
+    cache.get_stats()
+    cursor = cache._conn.execute("SELECT timestamp FROM cache WHERE key = ?", ("key1",))  # type: ignore[attr-defined]
+    assert cursor.fetchone()[0] == 1002.0
+
+    cache.close()
+
+
+def test_rejected_put_keeps_buffered_access_time(db_path: str) -> None:
+    """A put rejected as too large should not discard the key's earlier access time."""
+    small_size = len(EvictionModel(value=1).model_dump_json())
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=EvictionModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=2,
+        max_disk_size_bytes=2 * small_size + 10,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    cache.put("key1", EvictionModel(value=1), timestamp=1.0)
+    cache.put("key2", EvictionModel(value=2), timestamp=2.0)
+    cache.get("key1", timestamp=3.0)
+
+    with pytest.raises(ValueError, match="exceeds max_disk_size_bytes"):
+        cache.put("key1", EvictionModel(value=10**100), timestamp=4.0)
+
+    cache.put("key3", EvictionModel(value=3), timestamp=5.0)
+
+    # key1 was used after key2, so key2 is the LRU item on disk
+    remaining = [row[0] for row in cache._conn.execute("SELECT key FROM cache ORDER BY key")]  # type: ignore[attr-defined]
+    assert remaining == ["key1", "key3"]
+
+    cache.close()
+
+
 def test_disk_eviction_multiple_items(db_path: str) -> None:
     """Should evict multiple items from disk if needed."""
     cache = DiskBackedCache(
@@ -796,3 +914,158 @@ def test_disk_eviction_count_and_size_both_enforced(db_path: str) -> None:
     assert cache.get_total_size() <= 10 * 1024 * 1024  # Size limit not exceeded
 
     cache.close()
+
+
+@pytest.mark.parametrize("has_returning", [True, False])
+def test_disk_count_eviction_with_and_without_returning(
+    db_path: str, monkeypatch: pytest.MonkeyPatch, has_returning: bool
+) -> None:
+    """Count eviction should remove the same LRU victims whether or not DELETE ... RETURNING is used."""
+    monkeypatch.setattr(disk_backed_cache, "_SQLITE_HAS_RETURNING", has_returning)
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=EvictionModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=3,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    cache.put("b", EvictionModel(value=2), timestamp=1000.0)
+    cache.put("a", EvictionModel(value=1), timestamp=1000.0)
+    cache.put("c", EvictionModel(value=3), timestamp=2000.0)
+    cache.put_many({"d": EvictionModel(value=4), "e": EvictionModel(value=5)}, timestamp=3000.0)
+
+    # Equal timestamps: alphabetically smallest evicted first
+    remaining = [row[0] for row in cache._conn.execute("SELECT key FROM cache ORDER BY key")]  # type: ignore[attr-defined]
+    assert remaining == ["c", "d", "e"]
+    assert set(cache._memory_cache) == {"c", "d", "e"}  # type: ignore[attr-defined]
+    assert cache.get_count() == 3
+    assert cache.get_total_size() == sum(len(EvictionModel(value=i).model_dump_json()) for i in (3, 4, 5))
+    assert cache.get_stats()["disk_evictions"] == 2
+
+    cache.close()
+
+
+def test_disk_size_eviction_deletes_victims_in_one_statement(db_path: str) -> None:
+    """Size eviction freeing several items should remove them all with a single DELETE."""
+    item_size = len(EvictionModel(value=1).model_dump_json())
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=EvictionModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=item_size * 4,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    cache.put_many({key: EvictionModel(value=1) for key in ("a", "b", "c", "d")}, timestamp=1000.0)
+
+    statements: list[str] = []
+    cache._conn.set_trace_callback(statements.append)  # type: ignore[attr-defined]
+
+    cache.put_many({key: EvictionModel(value=2) for key in ("x", "y", "z")}, timestamp=2000.0)
+
+    cache._conn.set_trace_callback(None)  # type: ignore[attr-defined]
+    assert sum(s.startswith("DELETE") for s in statements) == 1
+    assert cache.get_many(["a", "b", "c", "d", "x", "y", "z"], timestamp=2000.0).keys() == {"d", "x", "y", "z"}
+    assert cache.get_stats()["disk_evictions"] == 3
+
+    cache.close()
+
+
+def test_disk_count_eviction_with_another_instance_deleting(db_path: str, request: pytest.FixtureRequest) -> None:
+    """Count eviction should count the rows on disk, not only this instance's own writes."""
+    if request.config.getoption("--db-mode") == "memory":
+        pytest.skip("Test requires a shared database file")
+
+    writer = DiskBackedCache(
+        db_path=db_path,
+        model=EvictionModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=3,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+    other = DiskBackedCache(
+        db_path=db_path,
+        model=EvictionModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=3,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    writer.put_many({f"k{i}": EvictionModel(value=i) for i in range(3)}, timestamp=1000.0)
+    other.delete_many(["k0", "k1"])
+    assert other.get_count() == 1
+    assert other.get_total_size() == len(EvictionModel(value=2).model_dump_json())
+
+    for i in range(3, 6):
+        writer.put(f"k{i}", EvictionModel(value=i), timestamp=1000.0 + i)
+
+    # Only k2 has to go once k5 takes the table over the limit
+    remaining = [row[0] for row in writer._conn.execute("SELECT key FROM cache ORDER BY key")]  # type: ignore[attr-defined]
+    assert remaining == ["k3", "k4", "k5"]
+    assert writer.get_count() == 3
+    assert writer.get_stats()["disk_evictions"] == 1
+
+    other.close()
+    writer.close()
+
+
+def test_disk_size_eviction_with_another_instance_deleting(db_path: str, request: pytest.FixtureRequest) -> None:
+    """Size eviction should sum the rows on disk, not only this instance's own writes."""
+    if request.config.getoption("--db-mode") == "memory":
+        pytest.skip("Test requires a shared database file")
+
+    item_size = len(EvictionModel(value=1).model_dump_json())
+    writer = DiskBackedCache(
+        db_path=db_path,
+        model=EvictionModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=item_size * 3,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+    other = DiskBackedCache(
+        db_path=db_path,
+        model=EvictionModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=item_size * 3,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    writer.put_many({f"k{i}": EvictionModel(value=i) for i in range(3)}, timestamp=1000.0)
+    other.delete_many(["k0", "k1"])
+
+    for i in range(3, 6):
+        writer.put(f"k{i}", EvictionModel(value=i), timestamp=1000.0 + i)
+
+    # Only k2 has to go once k5 takes the table over the limit
+    remaining = [row[0] for row in writer._conn.execute("SELECT key FROM cache ORDER BY key")]  # type: ignore[attr-defined]
+    assert remaining == ["k3", "k4", "k5"]
+    assert writer.get_total_size() == item_size * 3
+    assert writer.get_stats()["disk_evictions"] == 1
+
+    other.close()
+    writer.close()
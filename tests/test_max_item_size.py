@@ -94,8 +94,6 @@ def test_large_item_not_promoted_to_memory(db_path: str) -> None:
 
     # Clear memory (simulating eviction or restart)
     cache._memory_cache.clear()  # type: ignore[attr-defined]
-    cache._memory_timestamps.clear()  # type: ignore[attr-defined]
-    cache._memory_item_count = 0  # type: ignore[attr-defined]
     cache._memory_total_size = 0  # type: ignore[attr-defined]
 
     # Retrieve from disk
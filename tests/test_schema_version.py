@@ -48,8 +48,8 @@ def test_schema_version_stored_in_cache(db_path: str) -> None:
     cache.put("key1", obj)
 
     # Check memory cache
-    _, _, _, schema_version = cache._memory_cache["key1"]
-    assert schema_version == "1.0.0"
+    mem_obj, _, _ = cache._memory_cache["key1"]
+    assert mem_obj.schema_version == "1.0.0"
 
     # Check disk cache
     cursor = cache._conn.execute("SELECT schema_version FROM cache WHERE key = ?", ("key1",))
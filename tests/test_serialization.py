@@ -44,6 +44,27 @@ def test_serialize_model_to_json(db_path: str) -> None:
     cache.close()
 
 
+def test_serialize_matches_model_dump_json(db_path: str) -> None:
+    """Serialized bytes should be exactly the model's own JSON, so stored sizes stay comparable."""
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=SerializableModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    obj = SerializableModel(name='t\u00e9st "quoted"', count=-7, active=False)
+
+    assert cache._serialize(obj) == obj.model_dump_json().encode()  # type: ignore[attr-defined]
+
+    cache.close()
+
+
 def test_deserialize_json_to_model(db_path: str) -> None:
     """Deserializing JSON should produce a valid model."""
     cache = DiskBackedCache(
@@ -125,6 +146,31 @@ def test_serialization_size(db_path: str) -> None:
     cache.close()
 
 
+def test_serialization_size_counts_bytes_for_non_ascii(db_path: str) -> None:
+    """Size should be the UTF-8 byte length, not the number of code points."""
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=SerializableModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    obj = SerializableModel(name="ñandú", count=1, active=True)
+    cache.put("key1", obj)
+
+    expected = len(obj.model_dump_json().encode("utf-8"))
+    assert cache._calculate_size(obj) == expected  # type: ignore[attr-defined]
+    assert cache.get_total_size() == expected
+    assert cache.get("key1") == obj
+
+    cache.close()
+
+
 def test_deserialize_invalid_json_raises_error(db_path: str) -> None:
     """Deserializing invalid JSON should raise ValueError."""
     cache = DiskBackedCache(
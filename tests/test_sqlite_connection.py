@@ -63,7 +63,7 @@ def test_creates_table_with_schema(db_path: str) -> None:
     assert "size" in columns
 
     assert columns["key"] == "TEXT"
-    assert columns["value"] == "TEXT"
+    assert columns["value"] == "BLOB"
     assert columns["timestamp"] == "REAL"
     assert columns["schema_version"] == "TEXT"
     assert columns["size"] == "INTEGER"
@@ -93,6 +93,61 @@ def test_wal_mode_enabled(db_path: str) -> None:
     cache.close()
 
 
+def test_synchronous_mode_is_normal(db_path: str) -> None:
+    """Synchronous mode should be NORMAL (1) to avoid an fsync per commit."""
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=SimpleModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    cursor = cache._conn.execute("PRAGMA synchronous")  # type: ignore[attr-defined]
+    assert cursor.fetchone()[0] == 1
+
+    cache.close()
+
+
+def test_synchronous_mode_can_be_overridden(db_path: str) -> None:
+    """synchronous="FULL" should be applied; unknown modes should be rejected."""
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=SimpleModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+        synchronous="full",
+    )
+
+    cursor = cache._conn.execute("PRAGMA synchronous")  # type: ignore[attr-defined]
+    assert cursor.fetchone()[0] == 2
+
+    cache.close()
+
+    with pytest.raises(ValueError, match="synchronous must be one of"):
+        DiskBackedCache(
+            db_path=db_path,
+            model=SimpleModel,
+            max_memory_items=10,
+            max_memory_size_bytes=1024 * 1024,
+            max_disk_items=100,
+            max_disk_size_bytes=10 * 1024 * 1024,
+            memory_ttl_seconds=60.0,
+            disk_ttl_seconds=3600.0,
+            max_item_size_bytes=10 * 1024,
+            synchronous="FAST; DROP TABLE cache",
+        )
+
+
 def test_close_connection_works(db_path: str) -> None:
     """close() method should close the database connection."""
     cache = DiskBackedCache(
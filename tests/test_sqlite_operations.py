@@ -38,8 +38,8 @@ def test_put_stores_to_disk(db_path: str) -> None:
     key, value_json, schema_version = row
     assert key == "key1"
     assert schema_version == "1.0.0"
-    assert "test data" in value_json
-    assert "42" in value_json
+    assert b"test data" in value_json
+    assert b"42" in value_json
 
     cache.close()
 
@@ -135,8 +135,8 @@ def test_put_updates_disk_entry(db_path: str) -> None:
     # Should have the latest value
     cursor = cache._conn.execute("SELECT value FROM cache WHERE key = ?", ("key1",))  # type: ignore[attr-defined]
     value_json = cursor.fetchone()[0]
-    assert "second" in value_json
-    assert "2" in value_json
+    assert b"second" in value_json
+    assert b"2" in value_json
 
     cache.close()
 
@@ -167,7 +167,7 @@ def test_get_from_disk_promotes_to_memory(db_path: str) -> None:
 
     # Should now be in memory
     assert "key1" in cache._memory_cache  # type: ignore[attr-defined]
-    mem_obj = cache._memory_cache["key1"]  # type: ignore[attr-defined]
+    mem_obj, _, _ = cache._memory_cache["key1"]  # type: ignore[attr-defined]
     mem_obj_typed = cast(DataModel, mem_obj)
     assert mem_obj_typed.content == "promote test"
     assert mem_obj_typed.number == 777
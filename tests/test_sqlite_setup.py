@@ -99,3 +99,23 @@ def test_memory_database_works() -> None:
     assert result is not None
 
     cache.close()
+
+
+def test_lru_index_exists_after_init(db_path: str) -> None:
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=SampleModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    cursor = cache._conn.execute("PRAGMA index_info(cache_lru)")
+    columns = [row[2] for row in cursor.fetchall()]
+    assert columns == ["timestamp", "key", "size"]
+
+    cache.close()
@@ -1,7 +1,10 @@
 """Basic tests for thread safety infrastructure."""
 
+import threading
 from typing import cast
 
+import pytest
+
 from disk_backed_cache_example.disk_backed_cache import CacheableModel, DiskBackedCache
 
 
@@ -64,3 +67,82 @@ def test_sequential_operations_work(db_path: str) -> None:
         assert retrieved_typed.value == i
 
     cache.close()
+
+
+def test_concurrent_puts_and_gets_keep_counts_consistent(db_path: str) -> None:
+    """Concurrent puts and gets from several threads should leave consistent counts and stats."""
+    cache = DiskBackedCache(
+        db_path=db_path,
+        model=ThreadModel,
+        max_memory_items=20,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=1000,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    errors: list[BaseException] = []
+
+    def worker(thread_id: int) -> None:
+        try:
+            for i in range(50):
+                key = f"t{thread_id}_key{i}"
+                cache.put(key, ThreadModel(value=i))
+                assert cache.get(key) == ThreadModel(value=i)
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(thread_id,)) for thread_id in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    stats = cache.get_stats()
+    assert cache.get_count() == 200
+    assert stats["total_puts"] == 200
+    assert stats["total_gets"] == 200
+    assert stats["current_memory_items"] == 20
+
+    cache.close()
+
+
+def test_get_sees_items_written_by_another_instance(db_path: str, request: pytest.FixtureRequest) -> None:
+    """get() and get_many() should find items another cache instance wrote to the same database file."""
+    if request.config.getoption("--db-mode") == "memory":
+        pytest.skip("Test requires a shared database file")
+
+    reader = DiskBackedCache(
+        db_path=db_path,
+        model=ThreadModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+    writer = DiskBackedCache(
+        db_path=db_path,
+        model=ThreadModel,
+        max_memory_items=10,
+        max_memory_size_bytes=1024 * 1024,
+        max_disk_items=100,
+        max_disk_size_bytes=10 * 1024 * 1024,
+        memory_ttl_seconds=60.0,
+        disk_ttl_seconds=3600.0,
+        max_item_size_bytes=10 * 1024,
+    )
+
+    writer.put("key1", ThreadModel(value=1))
+    writer.put("key2", ThreadModel(value=2))
+
+    assert reader.get("key1") == ThreadModel(value=1)
+    assert reader.get_many(["key2"]) == {"key2": ThreadModel(value=2)}
+
+    writer.close()
+    reader.close()
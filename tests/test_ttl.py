@@ -47,8 +47,6 @@ def test_memory_ttl_expiration(db_path: str) -> None:
     # (Note: get() promotes from disk, so it will be back in memory now)
     # Let's verify by checking it was expired first
     cache._memory_cache.clear()  # type: ignore[attr-defined]
-    cache._memory_timestamps.clear()  # type: ignore[attr-defined]
-    cache._memory_item_count = 0  # type: ignore[attr-defined]
     cache._memory_total_size = 0  # type: ignore[attr-defined]
 
     # Put it back with old timestamp
@@ -120,8 +118,6 @@ def test_memory_expires_before_disk(db_path: str) -> None:
 
     # Verify by clearing memory and checking disk
     cache._memory_cache.clear()  # type: ignore[attr-defined]
-    cache._memory_timestamps.clear()  # type: ignore[attr-defined]
-    cache._memory_item_count = 0  # type: ignore[attr-defined]
     cache._memory_total_size = 0  # type: ignore[attr-defined]
 
     # Should still be retrievable from disk
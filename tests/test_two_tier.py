@@ -82,7 +82,6 @@ def test_get_promotes_from_disk_to_memory(db_path: str) -> None:
 
     # Clear memory to simulate disk-only state
     cache._memory_cache.clear()
-    cache._memory_count = 0
     cache._memory_total_size = 0
 
     # Get should promote to memory
@@ -115,7 +114,7 @@ def test_get_promotion_respects_memory_limits(db_path: str) -> None:
     result = cache.get("disk1", timestamp=20.0)
     assert result is not None
     assert "disk1" in cache._memory_cache
-    assert cache._memory_count <= 2
+    assert len(cache._memory_cache) <= 2
 
     cache.close()
 